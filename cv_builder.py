@@ -3,39 +3,80 @@ import json
 import os
 import tempfile
 import subprocess
-import copy
+import shutil
+import uuid
 import re
+import bisect
 import sqlite3
 import datetime
 import pytz
-from jinja2 import Environment, FileSystemLoader
-from pdf2image import convert_from_path
+import pandas as pd
 import base64
 from io import BytesIO
 
-# Utility function to escape LaTeX special characters
+# orjson is optional; when it is installed the CV data is serialized several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import; validate_url runs for every URL on each validation pass
+_URL_RE = re.compile(r'^(https?://)?[\w\-]+(\.[\w\-]+)+[/#?]?.*$')
+
+# CEFR proficiency levels offered by the Languages tab
+_CEFR_LEVELS = ("C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)")
+_CEFR_INDEX = {level: i for i, level in enumerate(_CEFR_LEVELS)}
+
+# LaTeX special characters and their escaped forms
+_LATEX_SPECIAL_CHARS = {
+    '&': r'\&',
+    '%': r'\%',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+    '\\': r'\textbackslash{}'
+}
+_LATEX_RE = re.compile('|'.join(re.escape(char) for char in _LATEX_SPECIAL_CHARS))
+
+# Utility function to escape LaTeX special characters (single pass, so inserted
+# backslashes and braces are never escaped a second time)
 def escape_latex(text):
     if not isinstance(text, str):
         text = str(text)
-    special_chars = {
-        '&': r'\&',
-        '%': r'\%',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\textasciicircum{}',
-        '\\': r'\textbackslash{}'
-    }
-    for char, escaped in special_chars.items():
-        text = text.replace(char, escaped)
-    return text
+    return _LATEX_RE.sub(lambda m: _LATEX_SPECIAL_CHARS[m.group(0)], text)
 
 # Validate URL format
 def validate_url(url):
-    regex = r'^(https?://)?[\w\-]+(\.[\w\-]+)+[/#?]?.*$'
-    return bool(re.match(regex, url)) if url else True
+    return bool(_URL_RE.match(url)) if url else True
+
+# Entry lists that carry a URL: (path into the data, grouped by year, label for error messages)
+_URL_FIELDS = (
+    (("publications", "under_review"), False, "Under Review Publication"),
+    (("publications", "by_year"), True, "Publication"),
+    (("conference_proceedings",), True, "Conference Proceeding"),
+    (("academic_activities", "profiles"), False, "Scholarly Profile"),
+    (("academic_activities", "talks"), False, "Invited Talk"),
+    (("academic_activities", "editorial"), False, "Editorial Work"),
+    (("memberships",), False, "Membership"),
+    (("skills", "softwares"), False, "Software"),
+)
+
+# Yield (url, label) for every entry listed in _URL_FIELDS
+def _iter_urls(data):
+    for path, by_year, label in _URL_FIELDS:
+        section = data
+        for key in path:
+            section = section[key]
+        if by_year:
+            for year, entries in section.items():
+                for entry in entries:
+                    yield entry['url'], f"{label} (Year {year})"
+        else:
+            for entry in section:
+                yield entry['url'], label
 
 # Validate required fields and URLs
 def validate_data(data):
@@ -45,101 +86,226 @@ def validate_data(data):
     if not data['languages']['mother_tongue']:
         errors.append("Mother Tongue is required.")
     for pub in data['publications']['under_review']:
-        if pub['url'] and not validate_url(pub['url']):
-            errors.append(f"Invalid URL in Under Review Publication: {pub['url']}")
         if not pub['title']:
             errors.append("Title is required for Under Review Publication.")
     for year, pubs in data['publications']['by_year'].items():
         for pub in pubs:
-            if pub['url'] and not validate_url(pub['url']):
-                errors.append(f"Invalid URL in Publication (Year {year}): {pub['url']}")
             if not pub['title']:
                 errors.append(f"Title is required for Publication (Year {year}).")
-    for year, confs in data['conference_proceedings'].items():
-        for conf in confs:
-            if conf['url'] and not validate_url(conf['url']):
-                errors.append(f"Invalid URL in Conference Proceeding (Year {year}): {conf['url']}")
-    for profile in data['academic_activities']['profiles']:
-        if profile['url'] and not validate_url(profile['url']):
-            errors.append(f"Invalid URL in Scholarly Profile: {profile['url']}")
-    for talk in data['academic_activities']['talks']:
-        if talk['url'] and not validate_url(talk['url']):
-            errors.append(f"Invalid URL in Invited Talk: {talk['url']}")
-    for edit in data['academic_activities']['editorial']:
-        if edit['url'] and not validate_url(edit['url']):
-            errors.append(f"Invalid URL in Editorial Work: {edit['url']}")
-    for membership in data['memberships']:
-        if membership['url'] and not validate_url(membership['url']):
-            errors.append(f"Invalid URL in Membership: {membership['url']}")
-    for software in data['skills']['softwares']:
-        if software['url'] and not validate_url(software['url']):
-            errors.append(f"Invalid URL in Software: {software['url']}")
+    for url, label in _iter_urls(data):
+        if not validate_url(url):
+            errors.append(f"Invalid URL in {label}: {url}")
     return errors
 
+# Build the Jinja environment once per distinct template and reuse it across reruns
+@st.cache_resource
+def load_template(tex_content):
+    from jinja2 import Environment, DictLoader  # Imported lazily: only needed when generating a CV
+    env = Environment(loader=DictLoader({'cv_template.tex': tex_content}), autoescape=False)
+    env.filters['escape_latex'] = escape_latex
+    return env.get_template('cv_template.tex')
+
+# Run one pdflatex pass; a draft pass only updates the .aux file and writes no PDF
+def run_latex(build_dir, draft=False):
+    cmd = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error']
+    if draft:
+        cmd.append('-draftmode')
+    cmd.append('cv.tex')
+    # Errors and the full transcript are in cv.log (shown on failure); piping the output would only buffer it
+    subprocess.run(cmd, cwd=build_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+# Per-session build directories live under one parent; only the most recently used are kept
+_BUILD_ROOT = os.path.join(tempfile.gettempdir(), "cv_builder_builds")
+_MAX_BUILD_DIRS = 8
+
+# Remove all but the newest few build directories left behind by earlier sessions
+def prune_build_dirs(keep):
+    dirs = []
+    for entry in os.scandir(_BUILD_ROOT):
+        try:
+            dirs.append((entry.stat().st_mtime, entry.path))
+        except OSError:  # Removed by another session in the meantime
+            continue
+    dirs.sort()
+    for _, path in dirs[:max(0, len(dirs) - keep)]:
+        shutil.rmtree(path, ignore_errors=True)
+
+# Per-session build directory kept across reruns so LaTeX can reuse its .aux files
+def latex_build_dir():
+    if "build_dir" not in st.session_state:
+        os.makedirs(_BUILD_ROOT, exist_ok=True)
+        prune_build_dirs(_MAX_BUILD_DIRS - 1)
+        st.session_state["build_dir"] = os.path.join(_BUILD_ROOT, uuid.uuid4().hex)
+    build_dir = st.session_state["build_dir"]
+    # Recreated if pruned by another session; the mtime marks it as recently used
+    os.makedirs(build_dir, exist_ok=True)
+    os.utime(build_dir)
+    return build_dir
+
+# Compile rendered LaTeX to PDF; identical inputs reuse the previous PDF instead of rerunning pdflatex.
+# The build directory is not part of the cache key (leading underscore). Failures raise rather than
+# return, since st.cache_data does not cache exceptions and a retry should run LaTeX again.
+@st.cache_data(max_entries=32)
+def compile_pdf(generated_tex, sty_content, _build_dir):
+    with open(f"{_build_dir}/cv_style.sty", "w") as f:
+        f.write(sty_content)
+    with open(f"{_build_dir}/cv.tex", "w") as f:
+        f.write(generated_tex)
+    aux_path = f"{_build_dir}/cv.aux"
+    pdf_path = f"{_build_dir}/cv.pdf"
+    # The directory is reused, so drop the previous build's PDF: a run that exits cleanly but
+    # writes no PDF ("No pages of output") must raise below rather than serve the old CV
+    if os.path.exists(pdf_path):
+        os.remove(pdf_path)
+    try:
+        if shutil.which("latexmk"):
+            # latexmk reruns pdflatex only as often as the .aux from the last build requires
+            subprocess.run(['latexmk', '-pdf', '-interaction=nonstopmode', '-halt-on-error', 'cv.tex'], cwd=_build_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            previous_aux = None
+            if os.path.exists(aux_path):
+                with open(aux_path, "rb") as f:
+                    previous_aux = f.read()
+            else:
+                # No references resolved yet: lay out once without producing a PDF
+                run_latex(_build_dir, draft=True)
+            run_latex(_build_dir)
+            # References moved since the last build; one more pass settles them
+            if previous_aux is not None:
+                with open(aux_path, "rb") as f:
+                    if f.read() != previous_aux:
+                        run_latex(_build_dir)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # A run stopped by -halt-on-error can leave a truncated .aux that would break the next build
+        if os.path.exists(aux_path):
+            os.remove(aux_path)
+        raise
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+# Excerpt of the last build's cv.log, starting at the first LaTeX error ("!" line) if there is one
+def latex_log_excerpt(build_dir, lines=20):
+    log_path = os.path.join(build_dir, "cv.log")
+    if not os.path.exists(log_path):
+        return ""
+    with open(log_path, encoding="utf-8", errors="replace") as f:
+        log = f.read().splitlines()
+    start = next((i for i, line in enumerate(log) if line.startswith("!")), max(0, len(log) - lines))
+    return "\n".join(log[start:start + lines])
+
 # Generate LaTeX CV and PDF, return file contents
 def generate_latex_cv(data, tex_content, sty_content):
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        with open(f"{tmpdirname}/cv_template.tex", "w") as f:
-            f.write(tex_content)
-        with open(f"{tmpdirname}/cv_style.sty", "w") as f:
-            f.write(sty_content)
-        env = Environment(loader=FileSystemLoader(tmpdirname), autoescape=False)
-        env.filters['escape_latex'] = escape_latex
-        template = env.get_template('cv_template.tex')
-        generated_tex = template.render(data=data)
-        tex_path = f"{tmpdirname}/cv.tex"
-        with open(tex_path, "w") as f:
-            f.write(generated_tex)
+    generated_tex = load_template(tex_content).render(data=data)
+    build_dir = latex_build_dir()
+    try:
+        pdf_content = compile_pdf(generated_tex, sty_content, build_dir)
+    except subprocess.CalledProcessError:
+        st.error("LaTeX compilation failed. Please download the LaTeX file and compile it manually.")
+        log_excerpt = latex_log_excerpt(build_dir)
+        if log_excerpt:
+            st.code(log_excerpt, language="text")
         pdf_content = None
-        try:
-            subprocess.run(['pdflatex', '-interaction=nonstopmode', 'cv.tex'], cwd=tmpdirname, check=True, capture_output=True)
-            pdf_path = f"{tmpdirname}/cv.pdf"
-            if os.path.exists(pdf_path):
-                with open(pdf_path, "rb") as f:
-                    pdf_content = f.read()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            st.error("pdflatex not found or compilation failed. Please download the LaTeX file and compile it manually.")
-        return generated_tex, pdf_content
+    except FileNotFoundError:
+        st.error("pdflatex not found or no PDF was produced. Please download the LaTeX file and compile it manually.")
+        pdf_content = None
+    return generated_tex, pdf_content
 
 # Convert PDF to images for preview
 def pdf_to_images(pdf_content):
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-        tmp_pdf.write(pdf_content)
-        tmp_pdf_path = tmp_pdf.name
-    images = convert_from_path(tmp_pdf_path)
-    os.unlink(tmp_pdf_path)
+    from pdf2image import convert_from_bytes  # Imported lazily: pulls in PIL, only needed for previews
+    images = convert_from_bytes(pdf_content, fmt="png", thread_count=os.cpu_count() or 1, use_pdftocairo=True)
     image_data = []
     for img in images:
         buffered = BytesIO()
         img.save(buffered, format="PNG")
-        image_data.append(base64.b64encode(buffered.getvalue()).decode("utf-8"))
+        image_data.append(base64.b64encode(buffered.getvalue()).decode("ascii"))
     return image_data
 
+# Sort key for year-keyed sections: newest first, numeric rather than lexicographic
+def year_sort_key(year):
+    return -int(year) if year.isdigit() else 0
+
+# Add an empty year to a year-keyed section, keeping its keys ordered newest first
+def insert_year(section, year):
+    if year not in section:
+        items = list(section.items())
+        items.insert(bisect.bisect([year_sort_key(y) for y in section], year_sort_key(year)), (year, []))
+        section.clear()
+        section.update(items)
+
+# Order a loaded year-keyed section newest first, so renders can iterate it without sorting
+def sort_years(section):
+    items = sorted(section.items(), key=lambda item: year_sort_key(item[0]))
+    section.clear()
+    section.update(items)
+
+# Editable table for a list of entries, returned as a list of dicts. The table is only
+# reseeded from the data when its widget state is new, since st.data_editor re-applies
+# the user's edits on top of whatever data it is given. Bumping the version starts a new
+# widget; the seed is kept under one version-free name so old seeds are replaced, not leaked.
+def edit_entries(entries, columns, key, version=0):
+    editor_key = f"{key}_{version}"
+    base_key = f"{key}_base"
+    seed = st.session_state.get(base_key)
+    if editor_key not in st.session_state or seed is None or seed[0] != version:
+        df = pd.DataFrame(entries)
+        df = df.reindex(columns=list(dict.fromkeys([*columns, *df.columns])))
+        seed = st.session_state[base_key] = (version, df.fillna("").astype(str))
+    edited = st.data_editor(
+        seed[1],
+        column_config=columns,
+        num_rows="dynamic",
+        hide_index=True,
+        width="stretch",
+        key=editor_key
+    )
+    return edited.fillna("").astype(str).to_dict("records")
+
+# Widget callback: copy a changed widget value (keyed by its field name) into the CV data
+def store_field(section, field):
+    st.session_state["data"][section][field] = st.session_state[field]
+
+# Button callback for removing a list entry; callbacks run before the next rerun
+# renders, so the entry is already gone without an extra st.rerun()
+def remove_entry(entries, index):
+    entries.pop(index)
+
+# JSON text for the data: indented for the downloadable file, compact for the database copy
+# (only read back by json.loads, so the indentation is dropped, roughly half the bytes)
+def dump_json(data, indent=False):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 # Create new database with updated data
 def create_new_db(json_content, tex_content, sty_content):
     cest_tz = pytz.timezone("Europe/Paris")
     timestamp = datetime.datetime.now(cest_tz).strftime("%Y%m%d%H%M")
     db_filename = f"cv{timestamp}.db"
-    conn = sqlite3.connect(db_filename)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS cv_files (
+    # Built in memory and serialized, so nothing is written to or re-read from disk
+    conn = sqlite3.connect(":memory:")
+    # The database is always fresh, so no IF NOT EXISTS / OR REPLACE checks are needed
+    conn.execute('''
+        CREATE TABLE cv_files (
             filename TEXT PRIMARY KEY,
-            content TEXT,
+            content BLOB,
             created_at TEXT
         )
     ''')
     current_time = datetime.datetime.now(cest_tz).isoformat()
-    cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                  ("cv_data.json", json_content, current_time))
-    cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                  ("cv_template.tex", tex_content, current_time))
-    cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                  ("cv_style.sty", sty_content, current_time))
-    conn.commit()
+    # Stored as raw UTF-8 bytes; json.loads reads them back without a str round-trip.
+    # All three rows go in with one multi-row INSERT: one statement, one transaction.
+    with conn:
+        conn.execute(
+            "INSERT INTO cv_files (filename, content, created_at) VALUES (?, ?, ?), (?, ?, ?), (?, ?, ?)",
+            ("cv_data.json", json_content.encode("utf-8"), current_time,
+             "cv_template.tex", tex_content.encode("utf-8"), current_time,
+             "cv_style.sty", sty_content.encode("utf-8"), current_time)
+        )
+    db_content = conn.serialize()
     conn.close()
-    with open(db_filename, "rb") as f:
-        db_content = f.read()
     return db_filename, db_content
 
 # Streamlit app
@@ -160,10 +326,12 @@ default_data = {
     "memberships": [],
     "last_updated": ""
 }
+# Serialized once; json.loads builds a fresh per-session copy faster than a deep copy
+_DEFAULT_JSON = json.dumps(default_data)
 
 # Initialize session state
 if "data" not in st.session_state:
-    st.session_state["data"] = copy.deepcopy(default_data)
+    st.session_state["data"] = json.loads(_DEFAULT_JSON)
 if "tex_content" not in st.session_state:
     st.session_state["tex_content"] = ""
 if "sty_content" not in st.session_state:
@@ -176,27 +344,34 @@ if "pub_counter" not in st.session_state:
 # Sidebar navigation
 st.sidebar.header("Upload CV Database")
 db_file = st.sidebar.file_uploader("Upload CV Database (.db)", type=["db"])
-if db_file:
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_db:
-        tmp_db.write(db_file.read())
-        tmp_db_path = tmp_db.name
-    conn = sqlite3.connect(tmp_db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT filename, content FROM cv_files")
-    files = cursor.fetchall()
-    conn.close()
-    os.unlink(tmp_db_path)
-    
-    for filename, content in files:
+# Load a newly uploaded database once; reloading it on every rerun would overwrite edits
+if db_file and st.session_state.get("loaded_db_id") != db_file.file_id:
+    # Open the uploaded bytes directly as an in-memory database (Python 3.11+)
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(db_file.read())
+    for filename, content in conn.execute("SELECT filename, content FROM cv_files"):
+        # Older databases store TEXT, newer ones BLOB
+        if isinstance(content, bytes) and filename != "cv_data.json":
+            content = content.decode("utf-8")
         if filename == "cv_data.json":
             try:
-                st.session_state["data"] = json.loads(content)
+                loaded_data = json.loads(content)
+                sort_years(loaded_data["publications"]["by_year"])
+                sort_years(loaded_data["conference_proceedings"])
+                st.session_state["data"] = loaded_data
+                # Drop widget values bound by store_field so the fields show the loaded data
+                for section in ("personal_info", "languages"):
+                    for field in loaded_data[section]:
+                        st.session_state.pop(field, None)
             except json.JSONDecodeError:
                 st.error("Invalid JSON in database for cv_data.json")
         elif filename == "cv_template.tex":
             st.session_state["tex_content"] = content
         elif filename == "cv_style.sty":
             st.session_state["sty_content"] = content
+    conn.close()
+    st.session_state["loaded_db_id"] = db_file.file_id
+    st.session_state["pub_counter"] += 1  # Reseed table editors from the loaded data
     st.success("Database loaded successfully!")
 
 st.sidebar.header("Navigate Sections")
@@ -211,25 +386,25 @@ for tab_name in tab_names:
 # Main content area
 st.header(st.session_state["active_tab"])
 if st.session_state["active_tab"] == "Personal Info":
-    st.session_state["data"]["personal_info"]["name"] = st.text_input("Full Name", value=st.session_state["data"]["personal_info"]["name"], key="name")
-    st.session_state["data"]["personal_info"]["nationality"] = st.text_input("Nationality", value=st.session_state["data"]["personal_info"]["nationality"], key="nationality")
-    st.session_state["data"]["personal_info"]["dob"] = st.text_input("Date of Birth", value=st.session_state["data"]["personal_info"]["dob"], key="dob")
-    st.session_state["data"]["personal_info"]["current_address"] = st.text_input("Current Address", value=st.session_state["data"]["personal_info"]["current_address"], key="current_address")
-    st.session_state["data"]["personal_info"]["permanent_address"] = st.text_input("Permanent Address", value=st.session_state["data"]["personal_info"]["permanent_address"], key="permanent_address")
-    st.session_state["data"]["personal_info"]["email"] = st.text_input("Email", value=st.session_state["data"]["personal_info"]["email"], key="email")
+    st.text_input("Full Name", value=st.session_state["data"]["personal_info"]["name"], key="name", on_change=store_field, args=("personal_info", "name"))
+    st.text_input("Nationality", value=st.session_state["data"]["personal_info"]["nationality"], key="nationality", on_change=store_field, args=("personal_info", "nationality"))
+    st.text_input("Date of Birth", value=st.session_state["data"]["personal_info"]["dob"], key="dob", on_change=store_field, args=("personal_info", "dob"))
+    st.text_input("Current Address", value=st.session_state["data"]["personal_info"]["current_address"], key="current_address", on_change=store_field, args=("personal_info", "current_address"))
+    st.text_input("Permanent Address", value=st.session_state["data"]["personal_info"]["permanent_address"], key="permanent_address", on_change=store_field, args=("personal_info", "permanent_address"))
+    st.text_input("Email", value=st.session_state["data"]["personal_info"]["email"], key="email", on_change=store_field, args=("personal_info", "email"))
 
 elif st.session_state["active_tab"] == "Languages":
-    st.session_state["data"]["languages"]["mother_tongue"] = st.text_input("Mother Tongue", value=st.session_state["data"]["languages"]["mother_tongue"], key="mother_tongue")
+    st.text_input("Mother Tongue", value=st.session_state["data"]["languages"]["mother_tongue"], key="mother_tongue", on_change=store_field, args=("languages", "mother_tongue"))
     st.subheader("English Proficiency")
-    st.session_state["data"]["languages"]["english_listening"] = st.selectbox("English Listening", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["english_listening"]), key="english_listening")
-    st.session_state["data"]["languages"]["english_reading"] = st.selectbox("English Reading", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["english_reading"]), key="english_reading")
-    st.session_state["data"]["languages"]["english_speaking"] = st.selectbox("English Speaking", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["english_speaking"]), key="english_speaking")
-    st.session_state["data"]["languages"]["english_writing"] = st.selectbox("English Writing", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["english_writing"]), key="english_writing")
+    st.selectbox("English Listening", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["english_listening"], 0), key="english_listening", on_change=store_field, args=("languages", "english_listening"))
+    st.selectbox("English Reading", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["english_reading"], 0), key="english_reading", on_change=store_field, args=("languages", "english_reading"))
+    st.selectbox("English Speaking", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["english_speaking"], 0), key="english_speaking", on_change=store_field, args=("languages", "english_speaking"))
+    st.selectbox("English Writing", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["english_writing"], 0), key="english_writing", on_change=store_field, args=("languages", "english_writing"))
     st.subheader("Hindi Proficiency")
-    st.session_state["data"]["languages"]["hindi_listening"] = st.selectbox("Hindi Listening", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["hindi_listening"]), key="hindi_listening")
-    st.session_state["data"]["languages"]["hindi_reading"] = st.selectbox("Hindi Reading", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["hindi_reading"]), key="hindi_reading")
-    st.session_state["data"]["languages"]["hindi_speaking"] = st.selectbox("Hindi Speaking", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["hindi_speaking"]), key="hindi_speaking")
-    st.session_state["data"]["languages"]["hindi_writing"] = st.selectbox("Hindi Writing", ["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"], index=["C2 (proficient)", "C1 (proficient)", "B2 (independent)", "B1 (independent)", "A2 (basic)", "A1 (basic)"].index(st.session_state["data"]["languages"]["hindi_writing"]), key="hindi_writing")
+    st.selectbox("Hindi Listening", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["hindi_listening"], 0), key="hindi_listening", on_change=store_field, args=("languages", "hindi_listening"))
+    st.selectbox("Hindi Reading", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["hindi_reading"], 0), key="hindi_reading", on_change=store_field, args=("languages", "hindi_reading"))
+    st.selectbox("Hindi Speaking", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["hindi_speaking"], 0), key="hindi_speaking", on_change=store_field, args=("languages", "hindi_speaking"))
+    st.selectbox("Hindi Writing", _CEFR_LEVELS, index=_CEFR_INDEX.get(st.session_state["data"]["languages"]["hindi_writing"], 0), key="hindi_writing", on_change=store_field, args=("languages", "hindi_writing"))
 
 elif st.session_state["active_tab"] == "Professional Experience":
     if st.button("Add Professional Experience", key="add_exp"):
@@ -242,9 +417,7 @@ elif st.session_state["active_tab"] == "Professional Experience":
             exp["position"] = st.text_input(f"Position", value=exp["position"], key=f"exp_position_{i}")
             exp["employer"] = st.text_input(f"Employer", value=exp["employer"], key=f"exp_employer_{i}")
             exp["activity"] = st.text_area(f"Activity", value=exp["activity"], key=f"exp_activity_{i}")
-            if st.button(f"Remove Experience {i+1}", key=f"remove_exp_{i}"):
-                st.session_state["data"]["professional_experience"].pop(i)
-                st.rerun()
+            st.button(f"Remove Experience {i+1}", key=f"remove_exp_{i}", on_click=remove_entry, args=(st.session_state["data"]["professional_experience"], i))
 
 elif st.session_state["active_tab"] == "Education":
     if st.button("Add Education Entry", key="add_edu"):
@@ -257,33 +430,16 @@ elif st.session_state["active_tab"] == "Education":
             edu["qualification"] = st.text_input(f"Qualification", value=edu["qualification"], key=f"edu_qualification_{i}")
             edu["thesis_title"] = st.text_input(f"Thesis Title", value=edu["thesis_title"], key=f"edu_thesis_{i}")
             edu["organization"] = st.text_input(f"Organization", value=edu["organization"], key=f"edu_organization_{i}")
-            if st.button(f"Remove Education {i+1}", key=f"remove_edu_{i}"):
-                st.session_state["data"]["education"].pop(i)
-                st.rerun()
+            st.button(f"Remove Education {i+1}", key=f"remove_edu_{i}", on_click=remove_entry, args=(st.session_state["data"]["education"], i))
 
 elif st.session_state["active_tab"] == "Publications":
+    pub_columns = {"authors": "Authors", "title": "Title", "journal": "Journal", "url": "URL", "impact_factor": "Impact Factor", "citations": "Citations"}
     st.subheader("Under Review")
-    if st.button("Add Publication Under Review", key="add_pub_under"):
-        st.session_state["data"]["publications"]["under_review"].append({
-            "authors": "", "title": "", "journal": "", "url": "", "impact_factor": "", "citations": ""
-        })
-        st.session_state["pub_counter"] += 1
-    for i, pub in enumerate(st.session_state["data"]["publications"]["under_review"]):
-        with st.expander(f"Publication Under Review {i+1}"):
-            pub["authors"] = st.text_input(f"Authors", value=pub["authors"], key=f"pub_under_authors_{i}_{st.session_state['pub_counter']}")
-            pub["title"] = st.text_input(f"Title", value=pub["title"], key=f"pub_under_title_{i}_{st.session_state['pub_counter']}")
-            pub["journal"] = st.text_input(f"Journal", value=pub["journal"], key=f"pub_under_journal_{i}_{st.session_state['pub_counter']}")
-            pub["url"] = st.text_input(f"URL", value=pub["url"], key=f"pub_under_url_{i}_{st.session_state['pub_counter']}")
-            pub["impact_factor"] = st.text_input(f"Impact Factor", value=pub["impact_factor"], key=f"pub_under_if_{i}_{st.session_state['pub_counter']}")
-            pub["citations"] = st.text_input(f"Citations", value=pub["citations"], key=f"pub_under_citations_{i}_{st.session_state['pub_counter']}")
-            if st.button(f"Save Publication Under Review {i+1}", key=f"save_pub_under_{i}_{st.session_state['pub_counter']}"):
-                st.session_state["data"]["publications"]["under_review"][i] = pub
-                st.success(f"Publication Under Review {i+1} saved.")
-            if st.button(f"Remove Publication Under Review {i+1}", key=f"remove_pub_under_{i}_{st.session_state['pub_counter']}"):
-                st.session_state["data"]["publications"]["under_review"].pop(i)
-                st.session_state["pub_counter"] += 1
-                st.rerun()
+    st.session_state["data"]["publications"]["under_review"] = edit_entries(
+        st.session_state["data"]["publications"]["under_review"], pub_columns, key="pub_under_editor", version=st.session_state["pub_counter"]
+    )
     st.subheader("Published by Year")
+    by_year = st.session_state["data"]["publications"]["by_year"]
     year = st.text_input("Year for New Publication", key="pub_year")
     if st.button("Add Publication for Year", key="add_pub_year"):
         if not year:
@@ -291,41 +447,24 @@ elif st.session_state["active_tab"] == "Publications":
         elif not year.isdigit():
             st.error("Year must be a valid number.")
         else:
-            if year not in st.session_state["data"]["publications"]["by_year"]:
-                st.session_state["data"]["publications"]["by_year"][year] = []
-            st.session_state["data"]["publications"]["by_year"][year].append({
+            insert_year(by_year, year)
+            by_year[year].append({
                 "authors": "", "title": "", "journal": "", "url": "", "impact_factor": "", "citations": ""
             })
             st.session_state["pub_counter"] += 1
             st.success(f"New publication added for year {year}.")
-    for year in sorted(st.session_state["data"]["publications"]["by_year"].keys(), reverse=True):
+    for year in list(by_year):
         with st.expander(f"Year {year}"):
-            for i, pub in enumerate(st.session_state["data"]["publications"]["by_year"][year]):
-                st.subheader(f"Publication {i+1}")
-                authors = st.text_input(f"Authors (Year {year})", value=pub["authors"], key=f"pub_{year}_authors_{i}_{st.session_state['pub_counter']}")
-                title = st.text_input(f"Title", value=pub["title"], key=f"pub_{year}_title_{i}_{st.session_state['pub_counter']}")
-                journal = st.text_input(f"Journal", value=pub["journal"], key=f"pub_{year}_journal_{i}_{st.session_state['pub_counter']}")
-                url = st.text_input(f"URL", value=pub["url"], key=f"pub_{year}_url_{i}_{st.session_state['pub_counter']}")
-                impact_factor = st.text_input(f"Impact Factor", value=pub["impact_factor"], key=f"pub_{year}_if_{i}_{st.session_state['pub_counter']}")
-                citations = st.text_input(f"Citations", value=pub["citations"], key=f"pub_{year}_citations_{i}_{st.session_state['pub_counter']}")
-                pub["authors"] = authors
-                pub["title"] = title
-                pub["journal"] = journal
-                pub["url"] = url
-                pub["impact_factor"] = impact_factor
-                pub["citations"] = citations
-                st.session_state["data"]["publications"]["by_year"][year][i] = pub
-                if st.button(f"Save Publication {i+1} (Year {year})", key=f"save_pub_{year}_{i}_{st.session_state['pub_counter']}"):
-                    st.session_state["data"]["publications"]["by_year"][year][i] = pub
-                    st.success(f"Publication {i+1} (Year {year}) saved.")
-                if st.button(f"Remove Publication {i+1} (Year {year})", key=f"remove_pub_{year}_{i}_{st.session_state['pub_counter']}"):
-                    st.session_state["data"]["publications"]["by_year"][year].pop(i)
-                    if not st.session_state["data"]["publications"]["by_year"][year]:
-                        del st.session_state["data"]["publications"]["by_year"][year]
-                    st.session_state["pub_counter"] += 1
-                    st.rerun()
+            pubs = edit_entries(by_year[year], pub_columns, key=f"pub_{year}_editor", version=st.session_state["pub_counter"])
+            if pubs:
+                by_year[year] = pubs
+            else:
+                del by_year[year]
+                st.session_state.pop(f"pub_{year}_editor_base", None)
 
 elif st.session_state["active_tab"] == "Conference Proceedings":
+    conf_columns = {"authors": "Authors", "title": "Title", "venue": "Venue", "url": "URL", "citations": "Citations"}
+    proceedings = st.session_state["data"]["conference_proceedings"]
     conf_year = st.text_input("Year for New Conference Proceeding", key="conf_year")
     if st.button("Add Conference Proceeding", key="add_conf"):
         if not conf_year:
@@ -333,31 +472,20 @@ elif st.session_state["active_tab"] == "Conference Proceedings":
         elif not conf_year.isdigit():
             st.error("Year must be a valid number.")
         else:
-            if conf_year not in st.session_state["data"]["conference_proceedings"]:
-                st.session_state["data"]["conference_proceedings"][conf_year] = []
-            st.session_state["data"]["conference_proceedings"][conf_year].append({
+            insert_year(proceedings, conf_year)
+            proceedings[conf_year].append({
                 "authors": "", "title": "", "venue": "", "url": "", "citations": ""
             })
             st.session_state["pub_counter"] += 1
             st.success(f"New conference proceeding added for year {conf_year}.")
-    for year in sorted(st.session_state["data"]["conference_proceedings"].keys(), reverse=True):
+    for year in list(proceedings):
         with st.expander(f"Year {year}"):
-            for i, conf in enumerate(st.session_state["data"]["conference_proceedings"][year]):
-                st.subheader(f"Conference Proceeding {i+1}")
-                conf["authors"] = st.text_input(f"Authors (Year {year})", value=conf["authors"], key=f"conf_{year}_authors_{i}_{st.session_state['pub_counter']}")
-                conf["title"] = st.text_input(f"Title", value=conf["title"], key=f"conf_{year}_title_{i}_{st.session_state['pub_counter']}")
-                conf["venue"] = st.text_input(f"Venue", value=conf["venue"], key=f"conf_{year}_venue_{i}_{st.session_state['pub_counter']}")
-                conf["url"] = st.text_input(f"URL", value=conf["url"], key=f"conf_{year}_url_{i}_{st.session_state['pub_counter']}")
-                conf["citations"] = st.text_input(f"Citations", value=conf["citations"], key=f"conf_{year}_citations_{i}_{st.session_state['pub_counter']}")
-                if st.button(f"Save Conference Proceeding {i+1} (Year {year})", key=f"save_conf_{year}_{i}_{st.session_state['pub_counter']}"):
-                    st.session_state["data"]["conference_proceedings"][year][i] = conf
-                    st.success(f"Conference Proceeding {i+1} (Year {year}) saved.")
-                if st.button(f"Remove Conference Proceeding {i+1} (Year {year})", key=f"remove_conf_{year}_{i}_{st.session_state['pub_counter']}"):
-                    st.session_state["data"]["conference_proceedings"][year].pop(i)
-                    if not st.session_state["data"]["conference_proceedings"][year]:
-                        del st.session_state["data"]["conference_proceedings"][year]
-                    st.session_state["pub_counter"] += 1
-                    st.rerun()
+            confs = edit_entries(proceedings[year], conf_columns, key=f"conf_{year}_editor", version=st.session_state["pub_counter"])
+            if confs:
+                proceedings[year] = confs
+            else:
+                del proceedings[year]
+                st.session_state.pop(f"conf_{year}_editor_base", None)
 
 elif st.session_state["active_tab"] == "Book":
     st.session_state["data"]["book"]["authors"] = st.text_input("Book Authors", value=st.session_state["data"]["book"]["authors"], key="book_authors")
@@ -378,9 +506,7 @@ elif st.session_state["active_tab"] == "Academic Activities":
             conf["role"] = st.text_input(f"Role", value=conf["role"], key=f"conf_role_{i}")
             conf["event"] = st.text_input(f"Event", value=conf["event"], key=f"conf_event_{i}")
             conf["url"] = st.text_input(f"URL", value=conf["url"], key=f"conf_url_{i}")
-            if st.button(f"Remove Conference {i+1}", key=f"remove_conf_activity_{i}"):
-                st.session_state["data"]["academic_activities"]["conferences"].pop(i)
-                st.rerun()
+            st.button(f"Remove Conference {i+1}", key=f"remove_conf_activity_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["conferences"], i))
     st.subheader("Invited Talks")
     if st.button("Add Invited Talk", key="add_talk"):
         st.session_state["data"]["academic_activities"]["talks"].append({
@@ -392,9 +518,7 @@ elif st.session_state["active_tab"] == "Academic Activities":
             talk["title"] = st.text_input(f"Title", value=talk["title"], key=f"talk_title_{i}")
             talk["event"] = st.text_input(f"Event", value=talk["event"], key=f"talk_event_{i}")
             talk["url"] = st.text_input(f"URL", value=talk["url"], key=f"talk_url_{i}")
-            if st.button(f"Remove Talk {i+1}", key=f"remove_talk_{i}"):
-                st.session_state["data"]["academic_activities"]["talks"].pop(i)
-                st.rerun()
+            st.button(f"Remove Talk {i+1}", key=f"remove_talk_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["talks"], i))
     st.subheader("Editorial Works")
     if st.button("Add Editorial Work", key="add_edit"):
         st.session_state["data"]["academic_activities"]["editorial"].append({
@@ -406,9 +530,7 @@ elif st.session_state["active_tab"] == "Academic Activities":
             edit["role"] = st.text_input(f"Role", value=edit["role"], key=f"edit_role_{i}")
             edit["journal"] = st.text_input(f"Journal", value=edit["journal"], key=f"edit_journal_{i}")
             edit["url"] = st.text_input(f"URL", value=edit["url"], key=f"edit_url_{i}")
-            if st.button(f"Remove Editorial Work {i+1}", key=f"remove_edit_{i}"):
-                st.session_state["data"]["academic_activities"]["editorial"].pop(i)
-                st.rerun()
+            st.button(f"Remove Editorial Work {i+1}", key=f"remove_edit_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["editorial"], i))
     st.subheader("Scholarly Profiles")
     if st.button("Add Scholarly Profile", key="add_profile"):
         st.session_state["data"]["academic_activities"]["profiles"].append({
@@ -418,9 +540,7 @@ elif st.session_state["active_tab"] == "Academic Activities":
         with st.expander(f"Profile {i+1}"):
             profile["name"] = st.text_input(f"Name", value=profile["name"], key=f"profile_name_{i}")
             profile["url"] = st.text_input(f"URL", value=profile["url"], key=f"profile_url_{i}")
-            if st.button(f"Remove Profile {i+1}", key=f"remove_profile_{i}"):
-                st.session_state["data"]["academic_activities"]["profiles"].pop(i)
-                st.rerun()
+            st.button(f"Remove Profile {i+1}", key=f"remove_profile_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["profiles"], i))
     st.subheader("Papers Reviewed")
     if st.button("Add Review Entry", key="add_review"):
         st.session_state["data"]["academic_activities"]["reviews"].append({
@@ -430,34 +550,20 @@ elif st.session_state["active_tab"] == "Academic Activities":
         with st.expander(f"Review Entry {i+1}"):
             review["year"] = st.text_input(f"Year", value=review["year"], key=f"review_year_{i}")
             review["count"] = st.text_input(f"Number of Reviews", value=review["count"], key=f"review_count_{i}")
-            if st.button(f"Remove Review Entry {i+1}", key=f"remove_review_{i}"):
-                st.session_state["data"]["academic_activities"]["reviews"].pop(i)
-                st.rerun()
+            st.button(f"Remove Review Entry {i+1}", key=f"remove_review_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["reviews"], i))
     st.subheader("Journals Reviewed")
     if st.button("Add Journal", key="add_journal"):
         st.session_state["data"]["academic_activities"]["journals"].append("")
     for i, journal in enumerate(st.session_state["data"]["academic_activities"]["journals"]):
         st.session_state["data"]["academic_activities"]["journals"][i] = st.text_input(f"Journal {i+1}", value=journal, key=f"journal_{i}")
-        if st.button(f"Remove Journal {i+1}", key=f"remove_journal_{i}"):
-            st.session_state["data"]["academic_activities"]["journals"].pop(i)
-            st.rerun()
+        st.button(f"Remove Journal {i+1}", key=f"remove_journal_{i}", on_click=remove_entry, args=(st.session_state["data"]["academic_activities"]["journals"], i))
 
 elif st.session_state["active_tab"] == "Grants & Awards":
     st.subheader("Grants")
-    if st.button("Add Grant", key="add_grant"):
-        st.session_state["data"]["grants_awards"]["grants"].append({
-            "duration": "", "agency": "", "category": "", "number": "", "amount": ""
-        })
-    for i, grant in enumerate(st.session_state["data"]["grants_awards"]["grants"]):
-        with st.expander(f"Grant {i+1}"):
-            grant["duration"] = st.text_input(f"Duration", value=grant["duration"], key=f"grant_duration_{i}")
-            grant["agency"] = st.text_input(f"Funding Agency", value=grant["agency"], key=f"grant_agency_{i}")
-            grant["category"] = st.text_input(f"Category", value=grant["category"], key=f"grant_category_{i}")
-            grant["number"] = st.text_input(f"Grant Number", value=grant["number"], key=f"grant_number_{i}")
-            grant["amount"] = st.text_input(f"Amount", value=grant["amount"], key=f"grant_amount_{i}")
-            if st.button(f"Remove Grant {i+1}", key=f"remove_grant_{i}"):
-                st.session_state["data"]["grants_awards"]["grants"].pop(i)
-                st.rerun()
+    grant_columns = {"duration": "Duration", "agency": "Funding Agency", "category": "Category", "number": "Grant Number", "amount": "Amount"}
+    st.session_state["data"]["grants_awards"]["grants"] = edit_entries(
+        st.session_state["data"]["grants_awards"]["grants"], grant_columns, key="grant_editor", version=st.session_state["pub_counter"]
+    )
     st.subheader("Awards")
     if st.button("Add Award", key="add_award"):
         st.session_state["data"]["grants_awards"]["awards"].append({
@@ -467,9 +573,7 @@ elif st.session_state["active_tab"] == "Grants & Awards":
         with st.expander(f"Award {i+1}"):
             award["year"] = st.text_input(f"Year", value=award["year"], key=f"award_year_{i}")
             award["description"] = st.text_input(f"Description", value=award["description"], key=f"award_description_{i}")
-            if st.button(f"Remove Award {i+1}", key=f"remove_award_{i}"):
-                st.session_state["data"]["grants_awards"]["awards"].pop(i)
-                st.rerun()
+            st.button(f"Remove Award {i+1}", key=f"remove_award_{i}", on_click=remove_entry, args=(st.session_state["data"]["grants_awards"]["awards"], i))
 
 elif st.session_state["active_tab"] == "Skills & Memberships":
     st.subheader("Skills")
@@ -482,30 +586,21 @@ elif st.session_state["active_tab"] == "Skills & Memberships":
         with st.expander(f"Software {i+1}"):
             software["name"] = st.text_input(f"Name", value=software["name"], key=f"software_name_{i}")
             software["url"] = st.text_input(f"URL", value=software["url"], key=f"software_url_{i}")
-            if st.button(f"Remove Software {i+1}", key=f"remove_software_{i}"):
-                st.session_state["data"]["skills"]["softwares"].pop(i)
-                st.rerun()
+            st.button(f"Remove Software {i+1}", key=f"remove_software_{i}", on_click=remove_entry, args=(st.session_state["data"]["skills"]["softwares"], i))
     st.session_state["data"]["skills"]["parallel_computing"] = st.text_input("Parallel Computing", value=st.session_state["data"]["skills"]["parallel_computing"], key="parallel_computing")
     st.session_state["data"]["skills"]["experiments"] = st.text_input("Experiments", value=st.session_state["data"]["skills"]["experiments"], key="experiments")
     st.subheader("Memberships")
-    if st.button("Add Membership", key="add_membership"):
-        st.session_state["data"]["memberships"].append({
-            "name": "", "url": "", "details": ""
-        })
-    for i, membership in enumerate(st.session_state["data"]["memberships"]):
-        with st.expander(f"Membership {i+1}"):
-            membership["name"] = st.text_input(f"Name", value=membership["name"], key=f"membership_name_{i}")
-            membership["url"] = st.text_input(f"URL", value=membership["url"], key=f"membership_url_{i}")
-            membership["details"] = st.text_input(f"Details", value=membership["details"], key=f"membership_details_{i}")
-            if st.button(f"Remove Membership {i+1}", key=f"remove_membership_{i}"):
-                st.session_state["data"]["memberships"].pop(i)
-                st.rerun()
+    membership_columns = {"name": "Name", "url": "URL", "details": "Details"}
+    st.session_state["data"]["memberships"] = edit_entries(
+        st.session_state["data"]["memberships"], membership_columns, key="membership_editor", version=st.session_state["pub_counter"]
+    )
 
 # Save and Download Section
 st.header("Save and Download")
 # Debug: Show session state for publications (uncomment for debugging)
 # st.write("Debug: Current publications in session state:", st.session_state["data"]["publications"])
 col1, col2 = st.columns(2)
+save_data = False
 with col1:
     if st.button("Save Data to JSON"):
         errors = validate_data(st.session_state["data"])
@@ -515,12 +610,15 @@ with col1:
         else:
             cest_tz = pytz.timezone("Europe/Paris")
             st.session_state["data"]["last_updated"] = datetime.datetime.now(cest_tz).isoformat()
-            json_content = json.dumps(st.session_state["data"], indent=4)
-            with open("cv_data.json", "w") as f:
-                f.write(json_content)
-            st.success("Data saved to cv_data.json")
+            save_data = True
+# Serialize once per rerun, after any timestamp update, and share it with every consumer below
+json_content = dump_json(st.session_state["data"], indent=True)
+if save_data:
+    with open("cv_data.json", "w", encoding="utf-8") as f:
+        f.write(json_content)
+    col1.success("Data saved to cv_data.json")
 with col2:
-    st.download_button("Download JSON", json.dumps(st.session_state["data"], indent=4), file_name="cv_data.json", mime="text/json")
+    st.download_button("Download JSON", json_content, file_name="cv_data.json", mime="text/json")
     if st.session_state["tex_content"]:
         st.download_button("Download cv_template.tex", st.session_state["tex_content"], file_name="cv_template.tex", mime="text/plain")
     if st.session_state["sty_content"]:
@@ -537,8 +635,7 @@ if st.button("Generate CV"):
             st.error("Please upload a .db file containing cv_template.tex and cv_style.sty")
         else:
             generated_tex, pdf_content = generate_latex_cv(st.session_state["data"], st.session_state["tex_content"], st.session_state["sty_content"])
-            json_content = json.dumps(st.session_state["data"], indent=4)
-            
+
             # Download buttons for generated files
             st.download_button("Download LaTeX", generated_tex, file_name="cv.tex", mime="text/plain")
             if pdf_content:
@@ -552,5 +649,6 @@ if st.button("Generate CV"):
                 st.error("PDF compilation failed. Please download the LaTeX file and compile it manually.")
 
             # Create and offer new database download
-            db_filename, db_content = create_new_db(json_content, st.session_state["tex_content"], st.session_state["sty_content"])
+            db_json = dump_json(st.session_state["data"])
+            db_filename, db_content = create_new_db(db_json, st.session_state["tex_content"], st.session_state["sty_content"])
             st.download_button(f"Download Database ({db_filename})", db_content, file_name=db_filename, mime="application/octet-stream")
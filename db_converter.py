@@ -1,7 +1,6 @@
 import streamlit as st
 import sqlite3
 import datetime
-import os
 
 st.title("CV Database Converter")
 
@@ -21,34 +20,33 @@ if st.button("Create Database"):
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M")
         db_filename = f"cv{timestamp}.db"
 
-        # Create SQLite database
-        conn = sqlite3.connect(db_filename)
+        # Create SQLite database in memory and serialize it, so nothing is written to or re-read from disk
+        conn = sqlite3.connect(":memory:")
         cursor = conn.cursor()
 
-        # Create table
+        # Create table; the database is always fresh, so no IF NOT EXISTS / OR REPLACE checks are needed
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cv_files (
+            CREATE TABLE cv_files (
                 filename TEXT PRIMARY KEY,
                 content TEXT,
                 created_at TEXT
             )
         ''')
 
-        # Insert file contents
+        # Insert file contents with one prepared statement in a single transaction (one commit, one sync)
         current_time = datetime.datetime.now().isoformat()
-        cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                      ("cv_data.json", json_content, current_time))
-        cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                      ("cv_template.tex", tex_content, current_time))
-        cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                      ("cv_style.sty", sty_content, current_time))
-
-        conn.commit()
+        rows = [
+            ("cv_data.json", json_content, current_time),
+            ("cv_template.tex", tex_content, current_time),
+            ("cv_style.sty", sty_content, current_time)
+        ]
+        with conn:
+            cursor.executemany("INSERT INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)", rows)
+        db_content = conn.serialize()
         conn.close()
 
         # Provide download link for the database
-        with open(db_filename, "rb") as f:
-            st.download_button(f"Download {db_filename}", f, file_name=db_filename, mime="application/octet-stream")
+        st.download_button(f"Download {db_filename}", db_content, file_name=db_filename, mime="application/octet-stream")
         st.success(f"Database {db_filename} created successfully!")
     else:
         st.error("Please upload all three files: cv_data.json, cv_template.tex, and cv_style.sty.")
\ No newline at end of file
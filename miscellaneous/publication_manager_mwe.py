@@ -1,10 +1,18 @@
 import streamlit as st
 import json
 import sqlite3
-import os
-import tempfile
 import datetime
-import copy
+import pandas as pd
+
+# orjson is optional; when it is installed the CV data is serialized several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Publication fields and their column labels
+PUB_COLUMNS = {"authors": "Authors", "title": "Title", "journal": "Journal", "url": "URL", "impact_factor": "Impact Factor", "citations": "Citations"}
+PUB_FIELDS = tuple(PUB_COLUMNS)
 
 # Normalize publication data
 def normalize_publications(data):
@@ -15,63 +23,83 @@ def normalize_publications(data):
     if 'by_year' not in data['publications']:
         data['publications']['by_year'] = {}
     for pub in data['publications']['under_review']:
-        for key in ["authors", "title", "journal", "url", "impact_factor", "citations"]:
+        for key in PUB_FIELDS:
             if key not in pub:
                 pub[key] = ""
     for year, pubs in data['publications']['by_year'].items():
         for pub in pubs:
-            for key in ["authors", "title", "journal", "url", "impact_factor", "citations"]:
+            for key in PUB_FIELDS:
                 if key not in pub:
                     pub[key] = ""
     return data
 
-# Initialize expander states
-def initialize_expander_states(data):
-    expanded = {}
-    for i, _ in enumerate(data['publications']['under_review']):
-        expanded[f"under_review_{i}"] = False
-    for year, pubs in data['publications']['by_year'].items():
-        for i, _ in enumerate(pubs):
-            expanded[f"pub_{year}_{i}"] = False
-    return expanded
+# Editable table for a list of entries, returned as a list of dicts. The table is only
+# reseeded from the data when its widget state is new, since st.data_editor re-applies
+# the user's edits on top of whatever data it is given. Bumping the version starts a new
+# widget; the seed is kept under one version-free name so old seeds are replaced, not leaked.
+def edit_entries(entries, columns, key, version=0):
+    editor_key = f"{key}_{version}"
+    base_key = f"{key}_base"
+    seed = st.session_state.get(base_key)
+    if editor_key not in st.session_state or seed is None or seed[0] != version:
+        df = pd.DataFrame(entries)
+        df = df.reindex(columns=list(dict.fromkeys([*columns, *df.columns])))
+        seed = st.session_state[base_key] = (version, df.fillna("").astype(str))
+    edited = st.data_editor(
+        seed[1],
+        column_config=columns,
+        num_rows="dynamic",
+        hide_index=True,
+        width="stretch",
+        key=editor_key
+    )
+    return edited.fillna("").astype(str).to_dict("records")
+
+# JSON text for the data: indented for the downloadable file, compact for the database copy
+# (only read back by json.loads, so the indentation is dropped, roughly half the bytes)
+def dump_json(data, indent=False):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
 # Save to sqlite3 db
 def create_new_db(json_content):
     timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M")
     db_filename = f"publications_{timestamp}.db"
-    conn = sqlite3.connect(db_filename)
+    # Built in memory and serialized, so nothing is written to or re-read from disk
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
+    # The database is always fresh, so no IF NOT EXISTS / OR REPLACE checks are needed
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS cv_files (
+        CREATE TABLE cv_files (
             filename TEXT PRIMARY KEY,
             content TEXT,
             created_at TEXT
         )
     ''')
     current_time = datetime.datetime.now().isoformat()
-    cursor.execute("INSERT OR REPLACE INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
-                  ("cv_data.json", json_content, current_time))
-    conn.commit()
+    with conn:
+        cursor.execute("INSERT INTO cv_files (filename, content, created_at) VALUES (?, ?, ?)",
+                      ("cv_data.json", json_content, current_time))
+    db_content = conn.serialize()
     conn.close()
-    with open(db_filename, "rb") as f:
-        db_content = f.read()
     return db_filename, db_content
 
-# Default structure
-default_data = {
-    "publications": {
-        "under_review": [],
-        "by_year": {}
-    },
-    "last_updated": ""
-}
+# Default structure, built fresh for each session (cheaper than a deep copy)
+def fresh_data():
+    return {
+        "publications": {
+            "under_review": [],
+            "by_year": {}
+        },
+        "last_updated": ""
+    }
 
 # Initialize session state safely
 if "data" not in st.session_state:
-    st.session_state["data"] = copy.deepcopy(default_data)
-
-if "expanded_publications" not in st.session_state:
-    st.session_state["expanded_publications"] = initialize_expander_states(st.session_state["data"])
+    st.session_state["data"] = fresh_data()
 
 # --- Streamlit UI ---
 st.title("📚 Simple Publication Manager")
@@ -80,29 +108,23 @@ st.title("📚 Simple Publication Manager")
 st.sidebar.header("📥 Upload Database")
 db_file = st.sidebar.file_uploader("Upload Publication Database (.db)", type=["db"])
 
-if db_file:
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_db:
-        tmp_db.write(db_file.read())
-        tmp_db_path = tmp_db.name
-
+# Only load a newly uploaded file; reloading on every rerun would discard the edits
+if db_file and st.session_state.get("loaded_db_id") != db_file.file_id:
     try:
-        conn = sqlite3.connect(tmp_db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT filename, content FROM cv_files WHERE filename = 'cv_data.json'")
-        files = cursor.fetchall()
+        # Open the uploaded bytes directly as an in-memory database (Python 3.11+)
+        conn = sqlite3.connect(":memory:")
+        conn.deserialize(db_file.read())
+        row = conn.execute("SELECT content FROM cv_files WHERE filename = ?", ("cv_data.json",)).fetchone()
         conn.close()
-        os.unlink(tmp_db_path)
 
-        for filename, content in files:
-            if filename == "cv_data.json":
-                loaded_data = json.loads(content)
-                loaded_data = normalize_publications(loaded_data)
+        if row:
+            loaded_data = normalize_publications(json.loads(row[0]))
 
-                # Replace session state only if valid
-                st.session_state["data"] = loaded_data
-                st.session_state["expanded_publications"] = initialize_expander_states(loaded_data)
+            # Replace session state only if valid
+            st.session_state["data"] = loaded_data
+            st.session_state["loaded_db_id"] = db_file.file_id
 
-                st.success("✅ Database loaded successfully!")
+            st.success("✅ Database loaded successfully!")
 
     except Exception as e:
         st.error(f"❌ Failed to load database: {e}")
@@ -111,51 +133,24 @@ if db_file:
 st.header("📝 Publications")
 st.subheader("📄 Under Review")
 
-# Add new under-review publication
-with st.form(key="under_review_form"):
-    if st.form_submit_button("➕ Add Publication"):
-        st.session_state["data"]["publications"]["under_review"].append({
-            "authors": "", "title": "", "journal": "", "url": "", "impact_factor": "", "citations": ""
-        })
-        i = len(st.session_state["data"]["publications"]["under_review"]) - 1
-        st.session_state["expanded_publications"][f"under_review_{i}"] = True
-        st.rerun()
-
-# Editable publications
-for i, pub in enumerate(st.session_state["data"]["publications"]["under_review"]):
-    if f"under_review_{i}" not in st.session_state["expanded_publications"]:
-        st.session_state["expanded_publications"][f"under_review_{i}"] = False
-    with st.expander(f"Publication {i+1}", expanded=st.session_state["expanded_publications"][f"under_review_{i}"]):
-        with st.form(key=f"under_review_edit_form_{i}"):
-            authors = st.text_input("Authors", value=pub["authors"], key=f"pub_authors_{i}")
-            title = st.text_input("Title", value=pub["title"], key=f"pub_title_{i}")
-            journal = st.text_input("Journal", value=pub["journal"], key=f"pub_journal_{i}")
-            url = st.text_input("URL", value=pub["url"], key=f"pub_url_{i}")
-            impact = st.text_input("Impact Factor", value=pub["impact_factor"], key=f"pub_impact_{i}")
-            citations = st.text_input("Citations", value=pub["citations"], key=f"pub_citations_{i}")
-            if st.form_submit_button(f"✅ Update Publication {i+1}"):
-                st.session_state["data"]["publications"]["under_review"][i].update({
-                    "authors": authors,
-                    "title": title,
-                    "journal": journal,
-                    "url": url,
-                    "impact_factor": impact,
-                    "citations": citations
-                })
-                st.session_state["expanded_publications"][f"under_review_{i}"] = True
-                st.success(f"✔️ Publication {i+1} updated!")
+# Editable publications; the editor key follows the loaded file so an upload reseeds it
+st.session_state["data"]["publications"]["under_review"] = edit_entries(
+    st.session_state["data"]["publications"]["under_review"], PUB_COLUMNS,
+    key="under_review_editor", version=st.session_state.get("loaded_db_id", "")
+)
 
 # Save and Download
 st.header("💾 Save and Download")
 if st.button("💾 Save Data"):
     st.session_state["data"]["last_updated"] = datetime.datetime.now().isoformat()
-    json_content = json.dumps(st.session_state["data"], indent=4)
+    json_content = dump_json(st.session_state["data"], indent=True)
 
-    with open("publications.json", "w") as f:
+    with open("publications.json", "w", encoding="utf-8") as f:
         f.write(json_content)
     st.success("✅ Data saved to publications.json")
 
-    db_filename, db_content = create_new_db(json_content)
+    db_json = dump_json(st.session_state["data"])
+    db_filename, db_content = create_new_db(db_json)
     st.download_button(
         label=f"⬇️ Download Database ({db_filename})",
         data=db_content,